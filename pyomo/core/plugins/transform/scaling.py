@@ -10,19 +10,10 @@
 #  ___________________________________________________________________________
 
 from pyomo.common.collections import ComponentMap
-from pyomo.core.base import (
-    Block,
-    Var,
-    Constraint,
-    Objective,
-    _ConstraintData,
-    _ObjectiveData,
-    Suffix,
-    value,
-)
+from pyomo.core.base import Block, Var, Constraint, Objective, Suffix
 from pyomo.core.plugins.transform.hierarchy import Transformation
 from pyomo.core.base import TransformationFactory
-from pyomo.core.expr import replace_expressions
+from pyomo.core.expr import ExpressionReplacementVisitor
 from pyomo.util.components import rename_components
 
 
@@ -89,7 +80,7 @@ class ScaleModel(Transformation):
         self._apply_to(scaled_model, **kwds)
         return scaled_model
 
-    def _suffix_finder(self, component_data, suffix_name, root=None):
+    def _suffix_finder(self, component_data, suffix_name, root=None, cache=None):
         """Find suffix value for a given component data object in model tree
 
         Suffixes are searched by traversing the model hierarchy in three passes:
@@ -123,6 +114,15 @@ class ScaleModel(Transformation):
             not in the subtree defined by `root`, then the search will
             proceed up to `component_data.model()`.
 
+        cache: dict
+
+            Optional dict used to memoize the Suffixes found on the
+            path from each block up to `root`.  Callers that look up
+            many components sharing the same blocks can pass the same
+            dict to each call to avoid repeatedly walking the block
+            hierarchy.  The cache is only valid for a single `root`
+            and must be discarded if Suffixes are added or removed.
+
         Returns
         -------
         The value for Suffix associated with component data if found, else None.
@@ -146,13 +146,19 @@ class ScaleModel(Transformation):
                 )
             root = root.parent_block()
         # Walk parent tree and search for suffixes
-        parent = component_data.parent_block()
-        suffixes = []
-        while parent is not root:
-            s = parent.component(suffix_name)
-            if s is not None and s.ctype is Suffix:
-                suffixes.append(s)
-            parent = parent.parent_block()
+        if cache is None:
+            suffixes = []
+            parent = component_data.parent_block()
+            while parent is not root:
+                s = parent.component(suffix_name)
+                if s is not None and s.ctype is Suffix:
+                    suffixes.append(s)
+                parent = parent.parent_block()
+            default_suffix = None
+        else:
+            suffixes, default_suffix = self._cached_suffixes(
+                component_data.parent_block(), suffix_name, root, cache
+            )
         # Pass 1: look for the component_data, working root to leaf
         for s in reversed(suffixes):
             if component_data in s:
@@ -164,13 +170,50 @@ class ScaleModel(Transformation):
                 if parent_comp in s:
                     return s[parent_comp]
         # Pass 3: look for None, working leaf to root
+        if cache is not None:
+            if default_suffix is None:
+                return None
+            return default_suffix[None]
         for s in suffixes:
             if None in s:
                 return s[None]
         return None
 
-    def _get_float_scaling_factor(self, instance, component_data):
-        scaling_factor = self._suffix_finder(component_data, "scaling_factor")
+    def _cached_suffixes(self, block, suffix_name, root, cache):
+        """Return the (leaf to root) Suffixes above `block` and the first
+        of those Suffixes that defines a default (`None`) value.
+
+        Results are memoized in `cache` for `block` and every block
+        visited on the way up to the nearest block that was already
+        cached (or `root`).
+        """
+        # Walk up the tree until we reach the root or a block whose
+        # suffixes we have already collected
+        uncached = []
+        parent = block
+        ans = ([], None)
+        while parent is not root:
+            key = (id(parent), suffix_name)
+            if key in cache:
+                ans = cache[key]
+                break
+            uncached.append((key, parent))
+            parent = parent.parent_block()
+        # Now fill in the cache working back down toward the leaf
+        for key, parent in reversed(uncached):
+            suffixes, default_suffix = ans
+            s = parent.component(suffix_name)
+            if s is not None and s.ctype is Suffix:
+                suffixes = [s] + suffixes
+                if None in s:
+                    default_suffix = s
+            ans = cache[key] = (suffixes, default_suffix)
+        return ans
+
+    def _get_float_scaling_factor(self, instance, component_data, cache=None):
+        scaling_factor = self._suffix_finder(
+            component_data, "scaling_factor", cache=cache
+        )
 
         # If still no scaling factor, return 1.0
         if scaling_factor is None:
@@ -188,18 +231,78 @@ class ScaleModel(Transformation):
         return scaling_factor
 
     def _apply_to(self, model, rename=True):
-        # create a map of component to scaling factor
-        component_scaling_factor_map = ComponentMap()
+        # collect the Vars, Constraints, and Objectives with a single
+        # pass over the block hierarchy, noting if there is a
+        # scaling_factor Suffix anywhere in the model (or on any of its
+        # parent blocks)
+        component_list = []
+        variables = []
+        constraints = []
+        objectives = []
+        has_scaling_factor_suffix = False
+        parent = model.parent_block()
+        while parent is not None and not has_scaling_factor_suffix:
+            s = parent.component('scaling_factor')
+            has_scaling_factor_suffix = s is not None and s.ctype is Suffix
+            parent = parent.parent_block()
+        for blk in model.block_data_objects(descend_into=True):
+            if not has_scaling_factor_suffix:
+                s = blk.component('scaling_factor')
+                has_scaling_factor_suffix = s is not None and s.ctype is Suffix
+            for component in blk.component_objects(
+                ctype=(Var, Constraint, Objective), descend_into=False
+            ):
+                component_list.append(component)
+                if component.is_reference():
+                    # Skip any references - these should get picked up
+                    # when handling the actual component
+                    continue
+                if component.ctype is Var:
+                    variables.append(component)
+                elif component.ctype is Constraint:
+                    constraints.append(component)
+                else:
+                    objectives.append(component)
+
+        # create a map of component id() to scaling factor (a plain
+        # dict is cheaper than a ComponentMap for the lookups below)
+        sf_by_id = {}
 
         # if the scaling_method is 'user', get the scaling parameters from the suffixes
-        if self._scaling_method == 'user':
-            # get the scaling factors
-            for c in model.component_data_objects(
-                ctype=(Var, Constraint, Objective), descend_into=True
-            ):
-                component_scaling_factor_map[c] = self._get_float_scaling_factor(
-                    model, c
-                )
+        if self._scaling_method == 'user' and not has_scaling_factor_suffix:
+            # No scaling factors were specified: every factor is 1, so
+            # there is nothing to scale (beyond the optional renaming)
+            for component in component_list:
+                for c in component.values():
+                    sf_by_id[id(c)] = 1.0
+            variables = constraints = objectives = ()
+            uniform_sf = {}
+        elif self._scaling_method == 'user':
+            # get the scaling factors (caching the Suffixes found on
+            # each block so the hierarchy is only walked once per block).
+            # Note that References are included here so that data
+            # they point to outside this model still gets a factor.
+            suffix_cache = {}
+            # record the factor for any Var container whose data all
+            # share the same scaling factor (the common case when the
+            # factor is set on the container or through a default)
+            uniform_sf = {}
+            for component in component_list:
+                if component.ctype is not Var or component.is_reference():
+                    # uniform_sf is only used when scaling the Vars
+                    for c in component.values():
+                        sf_by_id[id(c)] = self._get_float_scaling_factor(
+                            model, c, suffix_cache
+                        )
+                    continue
+                factors = set()
+                for c in component.values():
+                    sf = sf_by_id[id(c)] = self._get_float_scaling_factor(
+                        model, c, suffix_cache
+                    )
+                    factors.add(sf)
+                if len(factors) == 1:
+                    uniform_sf[id(component)] = factors.pop()
         else:
             raise ValueError(
                 "ScaleModel transformation: unknown scaling_method found"
@@ -209,126 +312,130 @@ class ScaleModel(Transformation):
         if rename:
             # rename all the Vars, Constraints, and Objectives
             # from foo to scaled_foo
-            component_list = list(
-                model.component_objects(ctype=[Var, Constraint, Objective])
-            )
             scaled_component_to_original_name_map = rename_components(
                 model=model, component_list=component_list, prefix='scaled_'
             )
         else:
             scaled_component_to_original_name_map = ComponentMap(
-                [
-                    (comp, comp.name)
-                    for comp in model.component_objects(
-                        ctype=[Var, Constraint, Objective]
-                    )
-                ]
+                [(comp, comp.name) for comp in component_list]
             )
 
         # scale the variable bounds and values and build the variable substitution map
-        # for scaling vars in constraints
-        variable_substitution_map = ComponentMap()
-        already_scaled = set()
-        for variable in [
-            var for var in model.component_objects(ctype=Var, descend_into=True)
-        ]:
-            if variable.is_reference():
-                # Skip any references - these should get picked up when handling the actual variable
+        # for scaling vars in constraints (key: id() of component).  Vars
+        # with unit scaling factors are left out of the substitution map,
+        # as v / 1.0 is just v.
+        variable_substitution_dict = {}
+        for variable in variables:
+            container_sf = uniform_sf.get(id(variable), None)
+            if container_sf == 1:
+                # unit scaling leaves the bounds and values unchanged
                 continue
 
             # set the bounds/value for the scaled variable
-            for k in variable:
-                v = variable[k]
-                if id(v) in already_scaled:
-                    continue
-                already_scaled.add(id(v))
-                scaling_factor = component_scaling_factor_map[v]
-                variable_substitution_map[v] = v / scaling_factor
-
-                if v.lb is not None:
-                    v.setlb(v.lb * scaling_factor)
-                if v.ub is not None:
-                    v.setub(v.ub * scaling_factor)
+            for v in variable.values():
+                if container_sf is None:
+                    scaling_factor = sf_by_id[id(v)]
+                else:
+                    scaling_factor = container_sf
+                if scaling_factor != 1:
+                    variable_substitution_dict[id(v)] = v / scaling_factor
+
+                # read the bounds once (VarData.bounds only queries the
+                # domain once), then scale (swapping the bounds for
+                # negative scaling factors) before writing them back
+                lb, ub = v.bounds
+                if lb is not None:
+                    lb = lb * scaling_factor
+                if ub is not None:
+                    ub = ub * scaling_factor
                 if scaling_factor < 0:
-                    temp = v.lb
-                    v.setlb(v.ub)
-                    v.setub(temp)
+                    lb, ub = ub, lb
+                v.bounds = (lb, ub)
 
-                if v.value is not None:
+                val = v.value
+                if val is not None:
                     # Since the value was OK in the unscaled space, it
                     # should be safe to assume it is still valid in the
                     # scaled space)
-                    v.set_value(value(v) * scaling_factor, skip_validation=True)
+                    v.set_value(val * scaling_factor, skip_validation=True)
 
         # scale the objectives/constraints and perform the scaled variable substitution
-        scale_constraint_dual = False
-        if type(model.component('dual')) is Suffix:
-            scale_constraint_dual = True
-
-        # translate the variable_substitution_map (ComponentMap)
-        # to variable_substitution_dict (key: id() of component)
-        # ToDo: We should change replace_expressions to accept a ComponentMap as well
-        variable_substitution_dict = {
-            id(k): variable_substitution_map[k] for k in variable_substitution_map
-        }
-
-        already_scaled = set()
-        for component in model.component_objects(
-            ctype=(Constraint, Objective), descend_into=True
-        ):
-            if component.is_reference():
-                # Skip any references - these should get picked up when handling the actual component
-                continue
+        dual = model.component('dual')
+        scale_constraint_dual = type(dual) is Suffix
+
+        # build the expression walker once and reuse it for every
+        # constraint and objective
+        visitor = ExpressionReplacementVisitor(
+            substitute=variable_substitution_dict,
+            descend_into_named_expressions=True,
+            remove_named_expressions=True,
+        )
 
-            for k in component:
-                c = component[k]
-                if id(c) in already_scaled:
+        for component in constraints:
+            for c in component.values():
+                # perform the constraint scaling and variable sub
+                scaling_factor = sf_by_id[id(c)]
+                if scaling_factor == 1:
+                    # Unit scaling: only rewrite the constraint if the
+                    # body contains scaled variables
+                    if not variable_substitution_dict:
+                        continue
+                    orig_body = c.body
+                    body = visitor.walk_expression(orig_body)
+                    if body is orig_body:
+                        continue
+                    # the bounds (and dual) are unchanged by a unit
+                    # scaling factor, so only the body is replaced
+                    if c.equality:
+                        c.set_value((c.lower, body))
+                    else:
+                        c.set_value((c.lower, body, c.upper))
                     continue
-                already_scaled.add(id(c))
-                # perform the constraint/objective scaling and variable sub
-                scaling_factor = component_scaling_factor_map[c]
-                if isinstance(c, _ConstraintData):
-                    body = scaling_factor * replace_expressions(
-                        expr=c.body,
-                        substitution_map=variable_substitution_dict,
-                        descend_into_named_expressions=True,
-                        remove_named_expressions=True,
-                    )
 
-                    # scale the rhs
-                    lower = c.lower
-                    upper = c.upper
-                    if lower is not None:
-                        lower = lower * scaling_factor
-                    if upper is not None:
-                        upper = upper * scaling_factor
+                body = scaling_factor * visitor.walk_expression(c.body)
 
-                    if scaling_factor < 0:
-                        lower, upper = upper, lower
+                if scale_constraint_dual and c in dual:
+                    dual_value = dual[c]
+                    if dual_value is not None:
+                        dual[c] = dual_value / scaling_factor
 
-                    if scale_constraint_dual and c in model.dual:
-                        dual_value = model.dual[c]
-                        if dual_value is not None:
-                            model.dual[c] = dual_value / scaling_factor
+                # scale the rhs
+                if c.equality:
+                    # equality constraints have a single (shared) bound
+                    c.set_value((c.lower * scaling_factor, body))
+                    continue
 
-                    if c.equality:
-                        c.set_value((lower, body))
-                    else:
-                        c.set_value((lower, body, upper))
-
-                elif isinstance(c, _ObjectiveData):
-                    c.expr = scaling_factor * replace_expressions(
-                        expr=c.expr,
-                        substitution_map=variable_substitution_dict,
-                        descend_into_named_expressions=True,
-                        remove_named_expressions=True,
-                    )
+                lower = c.lower
+                upper = c.upper
+                if lower is not None:
+                    lower = lower * scaling_factor
+                if upper is not None:
+                    upper = upper * scaling_factor
+
+                if scaling_factor < 0:
+                    lower, upper = upper, lower
+
+                c.set_value((lower, body, upper))
+
+        for component in objectives:
+            for c in component.values():
+                # perform the objective scaling and variable sub
+                scaling_factor = sf_by_id[id(c)]
+                if scaling_factor == 1:
+                    if not variable_substitution_dict:
+                        continue
+                    orig_expr = c.expr
+                    expr = visitor.walk_expression(orig_expr)
+                    if expr is not orig_expr:
+                        c.expr = expr
                 else:
-                    raise NotImplementedError(
-                        'Unknown object type found when applying scaling factors in ScaleModel transformation - Internal Error'
-                    )
+                    c.expr = scaling_factor * visitor.walk_expression(c.expr)
 
-        model.component_scaling_factor_map = component_scaling_factor_map
+        model.component_scaling_factor_map = ComponentMap(
+            (c, sf_by_id[id(c)])
+            for component in component_list
+            for c in component.values()
+        )
         model.scaled_component_to_original_name_map = (
             scaled_component_to_original_name_map
         )
@@ -370,10 +477,15 @@ class ScaleModel(Transformation):
         )
 
         # transfer the variable values and reduced costs
-        check_reduced_costs = type(scaled_model.component('rc')) is Suffix
+        scaled_rc = scaled_model.component('rc')
+        scaled_dual = scaled_model.component('dual')
+        original_dual = original_model.component('dual')
+        # (there is nothing to transfer if the suffixes are empty)
+        check_reduced_costs = type(scaled_rc) is Suffix and len(scaled_rc) > 0
         check_dual = (
-            type(scaled_model.component('dual')) is Suffix
-            and type(original_model.component('dual')) is Suffix
+            type(scaled_dual) is Suffix
+            and type(original_dual) is Suffix
+            and len(scaled_dual) > 0
         )
 
         if check_reduced_costs or check_dual:
@@ -389,40 +501,108 @@ class ScaleModel(Transformation):
                     % (len(scaled_objectives))
                 )
             else:
-                objective_scaling_factor = component_scaling_factor_map[
-                    scaled_objectives[0]
-                ]
+                # the duals and reduced costs are all divided by the
+                # objective scaling factor, so compute its reciprocal once
+                inv_objective_scaling_factor = (
+                    1.0 / component_scaling_factor_map[scaled_objectives[0]]
+                )
+
+        # cache of scaled block id() -> corresponding original block
+        original_blocks = {id(scaled_model): original_model}
 
-        for scaled_v in scaled_model.component_objects(ctype=Var, descend_into=True):
+        # map of scaled VarData id() -> original VarData (used to
+        # transfer the reduced costs)
+        original_by_id = {}
+
+        # References are skipped: their data are transferred when
+        # handling the actual components
+        for scaled_v in (
+            v
+            for v in scaled_model.component_objects(ctype=Var, descend_into=True)
+            if not v.is_reference()
+        ):
             # get the unscaled_v from the original model
-            original_v_path = scaled_component_to_original_name_map[scaled_v]
-            # This will not work if decimal indices are present:
-            original_v = original_model.find_component(original_v_path)
+            original_v = self._find_original_component(
+                scaled_v,
+                scaled_component_to_original_name_map,
+                original_model,
+                original_blocks,
+            )
 
-            for k in scaled_v:
-                original_v[k].set_value(
-                    value(scaled_v[k]) / component_scaling_factor_map[scaled_v[k]],
-                    skip_validation=True,
+            for k, scaled_vd in scaled_v.items():
+                original_vd = original_v[k]
+                val = scaled_vd.value
+                if val is not None:
+                    val = val / component_scaling_factor_map[scaled_vd]
+                original_vd.set_value(val, skip_validation=True)
+                original_by_id[id(scaled_vd)] = original_vd
+
+        # transfer the reduced costs (only visiting the variables that
+        # actually have one)
+        if check_reduced_costs:
+            original_rc = original_model.rc
+            for scaled_vd, rc_value in scaled_rc.items():
+                original_vd = original_by_id.get(id(scaled_vd), None)
+                if original_vd is None:
+                    continue
+                original_rc[original_vd] = (
+                    rc_value
+                    * component_scaling_factor_map[scaled_vd]
+                    * inv_objective_scaling_factor
                 )
-                if check_reduced_costs and scaled_v[k] in scaled_model.rc:
-                    original_model.rc[original_v[k]] = (
-                        scaled_model.rc[scaled_v[k]]
-                        * component_scaling_factor_map[scaled_v[k]]
-                        / objective_scaling_factor
-                    )
 
-        # transfer the duals
+        # transfer the duals (only visiting the constraints that
+        # actually have one)
         if check_dual:
-            for scaled_c in scaled_model.component_objects(
-                ctype=Constraint, descend_into=True
-            ):
-                original_c = original_model.find_component(
-                    scaled_component_to_original_name_map[scaled_c]
+            # cache of scaled Constraint id() -> original Constraint
+            original_constraints = {}
+            for scaled_cd, dual_value in scaled_dual.items():
+                if scaled_cd.ctype is not Constraint:
+                    continue
+                scaled_c = scaled_cd.parent_component()
+                if id(scaled_c) in original_constraints:
+                    original_c = original_constraints[id(scaled_c)]
+                else:
+                    original_c = original_constraints[id(scaled_c)] = (
+                        self._find_original_component(
+                            scaled_c,
+                            scaled_component_to_original_name_map,
+                            original_model,
+                            original_blocks,
+                        )
+                    )
+                original_dual[original_c[scaled_cd.index()]] = (
+                    dual_value
+                    * component_scaling_factor_map[scaled_cd]
+                    * inv_objective_scaling_factor
                 )
 
-                for k in scaled_c:
-                    original_model.dual[original_c[k]] = (
-                        scaled_model.dual[scaled_c[k]]
-                        * component_scaling_factor_map[scaled_c[k]]
-                        / objective_scaling_factor
-                    )
+    def _find_original_component(
+        self, scaled_comp, name_map, original_model, original_blocks
+    ):
+        """Return the component in original_model corresponding to scaled_comp
+
+        Blocks are never renamed by this transformation, so rather than
+        parsing the full original name of every component, we locate
+        (and cache in original_blocks) the original copy of each parent
+        block once and then look the component up by its local name.
+        """
+        original_path = name_map[scaled_comp]
+        parent = scaled_comp.parent_block()
+        if id(parent) in original_blocks:
+            original_parent = original_blocks[id(parent)]
+        else:
+            original_parent = original_blocks[id(parent)] = (
+                original_model.find_component(parent.name)
+            )
+        if parent.parent_block() is None:
+            prefix = ''
+        else:
+            prefix = parent.name + '.'
+        original_comp = None
+        if original_parent is not None and original_path.startswith(prefix):
+            original_comp = original_parent.component(original_path[len(prefix) :])
+        if original_comp is None:
+            # This will not work if decimal indices are present:
+            original_comp = original_model.find_component(original_path)
+        return original_comp
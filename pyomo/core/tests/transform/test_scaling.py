@@ -599,6 +599,157 @@ class TestScaleModelTransformation(unittest.TestCase):
         self.assertAlmostEqual(pyo.value(model.con[3]), 10, 4)
         self.assertAlmostEqual(pyo.value(model.zcon), -8, 4)
 
+    def test_propagate_solution_hierarchical(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=1)
+        m.b = pyo.Block([1, 2])
+        for i in m.b:
+            m.b[i].y = pyo.Var([1, 2], initialize=i)
+            m.b[i].c = pyo.Constraint(expr=m.b[i].y[1] + m.b[i].y[2] >= m.x)
+        m.obj = pyo.Objective(expr=m.x + sum(m.b[i].y[1] for i in m.b))
+
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x] = 2.0
+        m.b[2].scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.b[2].scaling_factor[m.b[2].y] = -4.0
+
+        scaled = pyo.TransformationFactory('core.scale_model').create_using(m)
+        scaled.scaled_x.set_value(6.0)
+        for i in scaled.b:
+            scaled.b[i].scaled_y[1].set_value(8.0)
+            scaled.b[i].scaled_y[2].set_value(-12.0)
+
+        pyo.TransformationFactory('core.scale_model').propagate_solution(scaled, m)
+
+        self.assertAlmostEqual(m.x.value, 3.0)
+        self.assertAlmostEqual(m.b[1].y[1].value, 8.0)
+        self.assertAlmostEqual(m.b[1].y[2].value, -12.0)
+        self.assertAlmostEqual(m.b[2].y[1].value, -2.0)
+        self.assertAlmostEqual(m.b[2].y[2].value, 3.0)
+
+    def test_propagate_solution_empty_suffixes(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=1)
+        m.c = pyo.Constraint(expr=m.x >= 0)
+        m.obj1 = pyo.Objective(expr=m.x)
+        m.obj2 = pyo.Objective(expr=-m.x)
+        m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        m.rc = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x] = 4.0
+
+        scaled = pyo.TransformationFactory('core.scale_model').create_using(m)
+        scaled.scaled_x.set_value(2.0)
+        # No duals or reduced costs were loaded, so neither the
+        # (missing) dual values nor the multiple objectives are an issue
+        pyo.TransformationFactory('core.scale_model').propagate_solution(scaled, m)
+        self.assertAlmostEqual(m.x.value, 0.5)
+        self.assertEqual(len(m.dual), 0)
+        self.assertEqual(len(m.rc), 0)
+
+    def test_propagate_solution_partial_suffixes(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2], initialize=1)
+        m.c = pyo.Constraint([1, 2], rule=lambda m, i: m.x[i] >= i)
+        m.obj = pyo.Objective(expr=m.x[1] + m.x[2])
+        m.dual = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        m.rc = pyo.Suffix(direction=pyo.Suffix.IMPORT)
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x[2]] = 4.0
+        m.scaling_factor[m.c[2]] = 0.5
+        m.scaling_factor[m.obj] = 2.0
+
+        scaled = pyo.TransformationFactory('core.scale_model').create_using(m)
+        # Only load duals / reduced costs for some of the components
+        scaled.dual[scaled.scaled_c[2]] = 3.0
+        scaled.rc[scaled.scaled_x[2]] = 5.0
+        pyo.TransformationFactory('core.scale_model').propagate_solution(scaled, m)
+
+        self.assertEqual(len(m.dual), 1)
+        self.assertAlmostEqual(m.dual[m.c[2]], 3.0 * 0.5 / 2.0)
+        self.assertEqual(len(m.rc), 1)
+        self.assertAlmostEqual(m.rc[m.x[2]], 5.0 * 4.0 / 2.0)
+
+    def test_unit_scaling_skips_rewrite(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=2)
+        m.y = pyo.Var(bounds=(0, 5), initialize=3)
+        m.c1 = pyo.Constraint(expr=m.y <= 4)
+        m.c2 = pyo.Constraint(expr=m.x + m.y == 6)
+        m.obj = pyo.Objective(expr=m.y)
+
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x] = 0.5
+
+        c1_expr = m.c1.expr
+        c2_expr = m.c2.expr
+        obj_expr = m.obj.expr
+        pyo.TransformationFactory('core.scale_model').apply_to(m, rename=False)
+
+        # Neither c1 nor obj reference a scaled variable
+        self.assertIs(m.c1.expr, c1_expr)
+        self.assertIs(m.obj.expr, obj_expr)
+        self.assertEqual((m.y.lb, m.y.ub, m.y.value), (0, 5, 3))
+        # c2 has a unit scaling factor, but contains x
+        self.assertIsNot(m.c2.expr, c2_expr)
+        self.assertAlmostEqual(pyo.value(m.c2.body), 5)
+        self.assertAlmostEqual(m.x.value, 1)
+
+    def test_references_scaled_once(self):
+        m = pyo.ConcreteModel()
+        # Declare the References before the components they point to
+        m.a = pyo.Block()
+        m.b = pyo.Block()
+        m.b.x = pyo.Var([1, 2], bounds=(1, 4), initialize=2)
+        m.b.c = pyo.Constraint(expr=m.b.x[1] + m.b.x[2] <= 6)
+        m.a.x_ref = pyo.Reference(m.b.x)
+        m.a.c_ref = pyo.Reference(m.b.c)
+        m.x_ref = pyo.Reference(m.b.x[:])
+
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.b.x] = 2.0
+        m.scaling_factor[m.b.c] = 0.5
+
+        pyo.TransformationFactory('core.scale_model').apply_to(m)
+
+        for k in (1, 2):
+            self.assertIs(m.a.scaled_x_ref[k], m.b.scaled_x[k])
+            self.assertEqual(m.b.scaled_x[k].value, 4)
+            self.assertEqual(m.b.scaled_x[k].bounds, (2, 8))
+        self.assertEqual(m.b.scaled_c.upper.value, 3)
+        self.assertAlmostEqual(pyo.value(m.b.scaled_c.body), 2)
+
+    def test_no_scaling_factor_suffix(self):
+        m = pyo.ConcreteModel()
+        m.b = pyo.Block()
+        m.b.x = pyo.Var([1, 2], bounds=(0, 4), initialize=1)
+        m.b.c = pyo.Constraint(expr=m.b.x[1] + m.b.x[2] >= 1)
+        m.b.obj = pyo.Objective(expr=m.b.x[1])
+        c_expr = m.b.c.expr
+        obj_expr = m.b.obj.expr
+
+        pyo.TransformationFactory('core.scale_model').apply_to(m.b)
+
+        # Everything is renamed, but otherwise left untouched
+        self.assertIs(m.b.scaled_c.expr, c_expr)
+        self.assertIs(m.b.scaled_obj.expr, obj_expr)
+        for k in (1, 2):
+            self.assertEqual(m.b.scaled_x[k].bounds, (0, 4))
+            self.assertEqual(m.b.scaled_x[k].value, 1)
+        self.assertEqual(sorted(m.b.component_scaling_factor_map.values()), [1.0] * 4)
+
+        # A scaling_factor Suffix on a parent of the transformed block
+        # is still found
+        m = pyo.ConcreteModel()
+        m.b = pyo.Block()
+        m.b.x = pyo.Var(bounds=(0, 4), initialize=1)
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.b.x] = 0.5
+
+        pyo.TransformationFactory('core.scale_model').apply_to(m.b)
+        self.assertEqual(m.b.scaled_x.bounds, (0, 2))
+        self.assertEqual(m.b.scaled_x.value, 0.5)
+
     def test_get_float_scaling_factor_top_level(self):
         m = pyo.ConcreteModel()
         m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
@@ -764,6 +915,39 @@ class TestScaleModelTransformation(unittest.TestCase):
         ):
             _suffix_finder(m.b1.v2, "suffix", root=m.bn)
 
+    def test_suffix_finder_cache(self):
+        m = pyo.ConcreteModel()
+        m.v1 = pyo.Var()
+        m.b1 = pyo.Block()
+        m.b1.v2 = pyo.Var()
+        m.b1.b2 = pyo.Block()
+        m.b1.b2.v3 = pyo.Var([0, 1])
+        m.b1.b2.b3 = pyo.Block()
+        m.b1.b2.b3.v4 = pyo.Var()
+
+        m.suffix = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.b1.b2.suffix = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.suffix[None] = 1
+        m.b1.b2.suffix[None] = 2
+        m.suffix[m.b1.b2.v3] = 4
+        m.b1.b2.suffix[m.b1.b2.v3[0]] = 5
+
+        xfrm = ScaleModel()
+        comps = [m.v1, m.b1.v2, m.b1.b2.v3[0], m.b1.b2.v3[1], m.b1.b2.b3.v4]
+        for root in (None, m.b1):
+            cache = {}
+            # Query leaf blocks first so that later lookups hit cached ancestors
+            for c in reversed(comps):
+                self.assertEqual(
+                    xfrm._suffix_finder(c, "suffix", root=root, cache=cache),
+                    xfrm._suffix_finder(c, "suffix", root=root),
+                )
+            for c in comps:
+                self.assertEqual(
+                    xfrm._suffix_finder(c, "suffix", root=root, cache=cache),
+                    xfrm._suffix_finder(c, "suffix", root=root),
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
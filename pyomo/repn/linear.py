@@ -11,8 +11,6 @@
 import collections
 import logging
 import sys
-from operator import itemgetter
-from itertools import filterfalse
 
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.numeric_types import native_types, native_numeric_types
@@ -29,6 +27,7 @@ from pyomo.core.expr.numeric_expr import (
     SumExpression,
     NPV_SumExpression,
     ExternalFunctionExpression,
+    Numeric_NPV_Mixin,
 )
 from pyomo.core.expr.relational_expr import (
     EqualityExpression,
@@ -55,9 +54,33 @@ _CONSTANT = ExprType.CONSTANT
 _LINEAR = ExprType.LINEAR
 _GENERAL = ExprType.GENERAL
 
+# The ExprType values all fit in 6 bits, so the types of the node
+# arguments can be packed into a single (small) integer key for the exit
+# node dispatcher (avoiding the construction of a tuple for every node).
+# Note that packing drops the arity: (CONSTANT,), (CONSTANT, CONSTANT),
+# and (CONSTANT, CONSTANT, CONSTANT) all pack to 0.  This is only safe
+# because the handler table for each node type has a fixed arity.
+_STATE_SHIFT = 6
+
+
+# Returned by LinearRepnVisitor._eval_npv() when evaluating an NPV
+# expression raised an exception (the walker should descend into it)
+_eval_error = object()
+
+
+def _pack_state(*types):
+    state = 0
+    for i, _type in enumerate(types):
+        state |= _type << (i * _STATE_SHIFT)
+    return state
+
 
 def _merge_dict(dest_dict, mult, src_dict):
     if mult == 1:
+        if not dest_dict:
+            # Common case (e.g., the first term in a sum): bulk copy
+            dest_dict.update(src_dict)
+            return
         for vid, coef in src_dict.items():
             if vid in dest_dict:
                 dest_dict[vid] += coef
@@ -101,7 +124,7 @@ class LinearRepn(object):
         ans = self.__class__.__new__(self.__class__)
         ans.multiplier = self.multiplier
         ans.constant = self.constant
-        ans.linear = dict(self.linear)
+        ans.linear = self.linear.copy()
         ans.nonlinear = self.nonlinear
         return ans
 
@@ -118,19 +141,26 @@ class LinearRepn(object):
             if len(self.linear) == 1:
                 vid, coef = next(iter(self.linear.items()))
                 if coef == 1:
-                    ans += var_map[vid]
+                    linear = var_map[vid]
                 elif coef:
-                    ans += MonomialTermExpression((coef, var_map[vid]))
+                    linear = MonomialTermExpression((coef, var_map[vid]))
                 else:
-                    pass
+                    linear = None
             else:
-                ans += LinearExpression(
+                linear = LinearExpression(
                     [
                         MonomialTermExpression((coef, var_map[vid]))
                         for vid, coef in self.linear.items()
                         if coef
                     ]
                 )
+            if linear is None:
+                pass
+            elif self.nonlinear is None:
+                # 0 + linear is just linear: skip the operator dispatch
+                ans = linear
+            else:
+                ans += linear
         if self.constant:
             ans += self.constant
         if self.multiplier != 1:
@@ -142,35 +172,65 @@ class LinearRepn(object):
 
         Notes
         -----
-        This method assumes that the operator was "+". It is implemented
-        so that we can directly use a LinearRepn() as a data object in
-        the expression walker (thereby avoiding the function call for a
-        custom callback)
+        This method assumes that the operator was "+".  The visitor
+        merges the results for the arguments of a sum all at once (see
+        extend()); this is provided for appending a single result.
+
+        """
+        self.extend((other,))
+
+    def extend(self, others):
+        """Append a list of child results
+
+        Notes
+        -----
+        This method assumes that the operator was "+".  The visitor
+        collects the results for the arguments of a sum in a list (so
+        the walker can use list.append() and avoid the function call for
+        a custom callback) and merges them here all at once.
 
         """
-        # Note that self.multiplier will always be 1 (we only call append()
+        # Note that self.multiplier will always be 1 (we only call extend()
         # within a sum, so there is no opportunity for self.multiplier to
         # change). Omitting the assertion for efficiency.
         # assert self.multiplier == 1
-        _type, other = other
-        if _type is _CONSTANT:
-            self.constant += other
-            return
+        linear = self.linear
+        linear_get = linear.get
+        for _type, other in others:
+            if _type is _CONSTANT:
+                self.constant += other
+                continue
 
-        mult = other.multiplier
-        if other.constant:
-            self.constant += mult * other.constant
-        if other.linear:
-            _merge_dict(self.linear, mult, other.linear)
-        if other.nonlinear is not None:
-            if mult != 1:
-                nl = mult * other.nonlinear
-            else:
-                nl = other.nonlinear
-            if self.nonlinear is None:
-                self.nonlinear = nl
-            else:
-                self.nonlinear += nl
+            mult = other.multiplier
+            if other.constant:
+                self.constant += mult * other.constant
+            if other.linear:
+                if mult != 1:
+                    _merge_dict(linear, mult, other.linear)
+                elif not linear:
+                    # Child results are never used after they are
+                    # merged, so we can adopt the child's coefficient
+                    # dict instead of copying it (this is the common case
+                    # of a sum with a single linear summand, e.g.,
+                    # "LinearExpression + nonlinear_term")
+                    linear = self.linear = other.linear
+                    linear_get = linear.get
+                else:
+                    # By far the most common case: merge the terms in
+                    # place (inlining _merge_dict() to avoid the
+                    # function call)
+                    for vid, coef in other.linear.items():
+                        prev = linear_get(vid)
+                        linear[vid] = coef if prev is None else prev + coef
+            if other.nonlinear is not None:
+                if mult != 1:
+                    nl = mult * other.nonlinear
+                else:
+                    nl = other.nonlinear
+                if self.nonlinear is None:
+                    self.nonlinear = nl
+                else:
+                    self.nonlinear += nl
 
 
 def to_expression(visitor, arg):
@@ -251,7 +311,7 @@ def _handle_product_nonlinear(visitor, node, arg1, arg2):
     if x2.constant:
         c = x2.constant
         if c == 1:
-            ans.linear = dict(x1.linear)
+            ans.linear = x1.linear.copy()
         else:
             ans.linear = {vid: c * coef for vid, coef in x1.linear.items()}
     if x1.constant:
@@ -338,9 +398,9 @@ def _handle_pow_ANY_constant(visitor, node, arg1, arg2):
         _type, _arg = arg1
         ans = _type, _arg.duplicate()
         for i in range(1, int(exp)):
-            ans = visitor.exit_node_dispatcher[(ProductExpression, ans[0], _type)](
-                visitor, None, ans, (_type, _arg.duplicate())
-            )
+            ans = visitor.exit_node_dispatcher[ProductExpression][
+                ans[0] | _type << _STATE_SHIFT
+            ](visitor, None, ans, (_type, _arg.duplicate()))
         return ans
     elif exp == 0:
         return _CONSTANT, 1
@@ -589,11 +649,13 @@ def _before_complex(visitor, child):
 
 def _before_var(visitor, child):
     _id = id(child)
-    if _id not in visitor.var_map:
+    var_map = visitor.var_map
+    if _id not in var_map:
         if child.fixed:
             return False, (_CONSTANT, visitor._eval_fixed(child))
-        visitor.var_map[_id] = child
-        visitor.var_order[_id] = len(visitor.var_order)
+        var_map[_id] = child
+        var_order = visitor.var_order
+        var_order[_id] = len(var_order)
     ans = visitor.Result()
     ans.linear[_id] = 1
     return False, (_LINEAR, ans)
@@ -604,10 +666,10 @@ def _before_param(visitor, child):
 
 
 def _before_npv(visitor, child):
-    try:
-        return False, (_CONSTANT, visitor._eval_expr(child))
-    except (ValueError, ArithmeticError):
+    ans = visitor._eval_npv(child)
+    if ans is _eval_error:
         return True, None
+    return False, (_CONSTANT, ans)
 
 
 def _before_monomial(visitor, child):
@@ -617,9 +679,8 @@ def _before_monomial(visitor, child):
     #
     arg1, arg2 = child._args_
     if arg1.__class__ not in native_types:
-        try:
-            arg1 = visitor._eval_expr(arg1)
-        except (ValueError, ArithmeticError):
+        arg1 = visitor._eval_npv(arg1)
+        if arg1 is _eval_error:
             return True, None
 
     # Trap multiplication by 0 and nan.
@@ -637,11 +698,13 @@ def _before_monomial(visitor, child):
         return False, (_CONSTANT, arg1)
 
     _id = id(arg2)
-    if _id not in visitor.var_map:
+    var_map = visitor.var_map
+    if _id not in var_map:
         if arg2.fixed:
             return False, (_CONSTANT, arg1 * visitor._eval_fixed(arg2))
-        visitor.var_map[_id] = arg2
-        visitor.var_order[_id] = len(visitor.var_order)
+        var_map[_id] = arg2
+        var_order = visitor.var_order
+        var_order[_id] = len(var_order)
     ans = visitor.Result()
     ans.linear[_id] = arg1
     return False, (_LINEAR, ans)
@@ -654,13 +717,18 @@ def _before_linear(visitor, child):
     ans = visitor.Result()
     const = 0
     linear = ans.linear
+    linear_get = linear.get
+    eval_npv = visitor._eval_npv
+    # Local references to module globals used in the (hot) loop below
+    _MonomialTermExpression = MonomialTermExpression
+    _native_types = native_types
+    _native_numeric_types = native_numeric_types
     for arg in child.args:
-        if arg.__class__ is MonomialTermExpression:
+        if arg.__class__ is _MonomialTermExpression:
             arg1, arg2 = arg._args_
-            if arg1.__class__ not in native_types:
-                try:
-                    arg1 = visitor._eval_expr(arg1)
-                except (ValueError, ArithmeticError):
+            if arg1.__class__ not in _native_types:
+                arg1 = eval_npv(arg1)
+                if arg1 is _eval_error:
                     return True, None
 
             # Trap multiplication by 0 and nan.
@@ -686,17 +754,16 @@ def _before_linear(visitor, child):
                 var_order[_id] = next_i
                 next_i += 1
                 linear[_id] = arg1
-            elif _id in linear:
-                linear[_id] += arg1
             else:
-                linear[_id] = arg1
-        elif arg.__class__ in native_numeric_types:
+                coef = linear_get(_id)
+                linear[_id] = arg1 if coef is None else coef + arg1
+        elif arg.__class__ in _native_numeric_types:
             const += arg
         else:
-            try:
-                const += visitor._eval_expr(arg)
-            except (ValueError, ArithmeticError):
+            arg = eval_npv(arg)
+            if arg is _eval_error:
                 return True, None
+            const += arg
     if linear:
         ans.constant = const
         return False, (_LINEAR, ans)
@@ -705,15 +772,15 @@ def _before_linear(visitor, child):
 
 
 def _before_named_expression(visitor, child):
-    _id = id(child)
-    if _id in visitor.subexpression_cache:
-        _type, expr = visitor.subexpression_cache[_id]
-        if _type is _CONSTANT:
-            return False, (_type, expr)
-        else:
-            return False, (_type, expr.duplicate())
-    else:
+    cached = visitor.subexpression_cache.get(id(child))
+    if cached is None:
         return True, None
+    _type, expr = cached
+    if _type is _CONSTANT:
+        # Constant results are immutable: reuse the cached result
+        return False, cached
+    else:
+        return False, (_type, expr.duplicate())
 
 
 def _before_external(visitor, child):
@@ -764,8 +831,11 @@ def _register_new_before_child_dispatcher(visitor, child):
             visitor.exit_node_handlers[child_type] = visitor.exit_node_handlers[
                 pv_base_type
             ]
-            for args, fcn in visitor.exit_node_handlers[child_type].items():
-                visitor.exit_node_dispatcher[(child_type, *args)] = fcn
+            # The NPV class shares the (already packed) handler table
+            # of its potentially variable base class
+            visitor.exit_node_dispatcher[child_type] = visitor.exit_node_dispatcher[
+                pv_base_type
+            ]
     elif id(child) in visitor.subexpression_cache or issubclass(
         child_type, _GeneralExpressionData
     ):
@@ -773,8 +843,9 @@ def _register_new_before_child_dispatcher(visitor, child):
         visitor.exit_node_handlers[child_type] = visitor.exit_node_handlers[
             ScalarExpression
         ]
-        for args, fcn in visitor.exit_node_handlers[child_type].items():
-            visitor.exit_node_dispatcher[(child_type, *args)] = fcn
+        visitor.exit_node_dispatcher[child_type] = visitor.exit_node_dispatcher[
+            ScalarExpression
+        ]
     else:
         dispatcher[child_type] = _before_general_expression
     return dispatcher[child_type](visitor, child)
@@ -806,14 +877,41 @@ def _initialize_exit_node_dispatcher(exit_handlers):
     # expand the knowns set of named expressiosn
     for expr in _named_subexpression_types:
         exit_handlers[expr] = exit_handlers[ScalarExpression]
-
+    # The NPV expression types use the handlers of their potentially
+    # variable base class.  Register them up front (and not just lazily
+    # in _register_new_before_child_dispatcher), as the before child
+    # dispatcher is shared by all visitor classes (but the exit
+    # dispatchers are not).  Note that we always overwrite the NPV
+    # entries: derived handler dicts (e.g., quadratic.py) are copied
+    # from ours and may replace the base class handlers.
+    for cls in list(exit_handlers):
+        if not isinstance(cls, type):
+            # (kernel.expression.noclone is a function)
+            continue
+        for npv_cls in cls.__subclasses__():
+            if issubclass(npv_cls, Numeric_NPV_Mixin):
+                exit_handlers[npv_cls] = exit_handlers[cls]
+
+    # The dispatcher maps the node type to a table of handlers keyed by
+    # the packed types of the node arguments (see _pack_state).  Types
+    # that share handlers also share the packed table.
+    tables = {}
     exit_dispatcher = {}
     for cls, handlers in exit_handlers.items():
-        for args, fcn in handlers.items():
-            exit_dispatcher[(cls, *args)] = fcn
+        if id(handlers) not in tables:
+            tables[id(handlers)] = {
+                _pack_state(*args): fcn for args, fcn in handlers.items()
+            }
+        exit_dispatcher[cls] = tables[id(handlers)]
     return exit_dispatcher
 
 
+class _SumArgResults(list):
+    """List of the child results for the arguments of a sum"""
+
+    __slots__ = ()
+
+
 class LinearRepnVisitor(StreamBasedExpressionVisitor):
     Result = LinearRepn
     exit_node_handlers = _exit_node_handlers
@@ -826,6 +924,7 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         self.subexpression_cache = subexpression_cache
         self.var_map = var_map
         self.var_order = var_order
+        self.value_cache = {}
         self._eval_expr_visitor = _EvaluationVisitor(True)
 
     def _eval_fixed(self, obj):
@@ -859,6 +958,31 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
             return complex_number_error(ans, self, obj)
         return ans
 
+    def _eval_npv(self, expr):
+        # Leaf coefficients (mutable Params) are cheap to evaluate and
+        # rarely shared, so evaluate them directly (as _before_param does)
+        if not expr.is_expression_type():
+            return self._eval_fixed(expr)
+        # NPV expressions are frequently shared between expressions, so
+        # we cache their values for the lifetime of this visitor (as we
+        # do for named subexpressions).  Note that the cache holds a
+        # reference to the expression so that its id() cannot be reused
+        # by another object while the entry is in the cache.
+        #
+        # Evaluation errors are not cached: instead we return the
+        # _eval_error sentinel so that the caller can descend into the
+        # expression.  This keeps the exception handling off the
+        # (common) cached path and out of the callers.
+        _id = id(expr)
+        if _id in self.value_cache:
+            return self.value_cache[_id][1]
+        try:
+            ans = self._eval_expr(expr)
+        except (ValueError, ArithmeticError):
+            return _eval_error
+        self.value_cache[_id] = (expr, ans)
+        return ans
+
     def _eval_expr(self, expr):
         ans = self._eval_expr_visitor.dfs_postorder_stack(expr)
         if ans.__class__ not in native_numeric_types:
@@ -900,22 +1024,39 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
         return _before_child_dispatcher[child.__class__](self, child)
 
     def enterNode(self, node):
-        # SumExpression are potentially large nary operators.  Directly
-        # populate the result
+        # SumExpression are potentially large nary operators.  Collect
+        # the child results and merge them all at once in exitNode
         if node.__class__ in sum_like_expression_types:
-            return node.args, self.Result()
+            return node.args, _SumArgResults()
         else:
             return node.args, []
 
     def exitNode(self, node, data):
-        if data.__class__ is self.Result:
-            return data.walker_exitNode()
+        if data.__class__ is _SumArgResults:
+            ans = self.Result()
+            ans.extend(data)
+            return ans.walker_exitNode()
         #
         # General expressions...
         #
-        return self.exit_node_dispatcher[(node.__class__, *map(itemgetter(0), data))](
-            self, node, *data
-        )
+        # Note: unroll the common (fixed) arities so we can index the
+        # child results directly (and pass them as positional arguments)
+        n = len(data)
+        if n == 2:
+            arg1, arg2 = data
+            return self.exit_node_dispatcher[node.__class__][
+                arg1[0] | arg2[0] << _STATE_SHIFT
+            ](self, node, arg1, arg2)
+        elif n == 1:
+            arg1 = data[0]
+            return self.exit_node_dispatcher[node.__class__][arg1[0]](self, node, arg1)
+        elif n == 3:
+            arg1, arg2, arg3 = data
+            return self.exit_node_dispatcher[node.__class__][
+                arg1[0] | arg2[0] << _STATE_SHIFT | arg3[0] << 2 * _STATE_SHIFT
+            ](self, node, arg1, arg2, arg3)
+        state = _pack_state(*(arg[0] for arg in data))
+        return self.exit_node_dispatcher[node.__class__][state](self, node, *data)
 
     def finalizeResult(self, result):
         ans = result[1]
@@ -923,9 +1064,10 @@ class LinearRepnVisitor(StreamBasedExpressionVisitor):
             mult = ans.multiplier
             if mult == 1:
                 # mult is identity: only thing to do is filter out zero coefficients
-                zeros = list(filterfalse(itemgetter(1), ans.linear.items()))
-                for vid, coef in zeros:
-                    del ans.linear[vid]
+                linear = ans.linear
+                zeros = [vid for vid, coef in linear.items() if not coef]
+                for vid in zeros:
+                    del linear[vid]
             elif not mult:
                 # the mulltiplier has cleared out the entire expression.
                 # Warn if this is suppressing a NaN (unusual, and
@@ -72,9 +72,9 @@ class QuadraticRepn(object):
         ans = self.__class__.__new__(self.__class__)
         ans.multiplier = self.multiplier
         ans.constant = self.constant
-        ans.linear = dict(self.linear)
+        ans.linear = self.linear.copy()
         if self.quadratic:
-            ans.quadratic = dict(self.quadratic)
+            ans.quadratic = self.quadratic.copy()
         else:
             ans.quadratic = None
         ans.nonlinear = self.nonlinear
@@ -125,38 +125,51 @@ class QuadraticRepn(object):
 
         Notes
         -----
-        This method assumes that the operator was "+". It is implemented
-        so that we can directly use a QuadraticRepn() as a data object in
-        the expression walker (thereby avoiding the function call for a
-        custom callback)
+        This method assumes that the operator was "+".  The visitor
+        merges the results for the arguments of a sum all at once (see
+        extend()); this is provided for appending a single result.
 
         """
-        # Note that self.multiplier will always be 1 (we only call append()
+        self.extend((other,))
+
+    def extend(self, others):
+        """Append a list of child results
+
+        Notes
+        -----
+        This method assumes that the operator was "+".  The visitor
+        collects the results for the arguments of a sum in a list (so
+        the walker can use list.append() and avoid the function call for
+        a custom callback) and merges them here all at once.
+
+        """
+        # Note that self.multiplier will always be 1 (we only call extend()
         # within a sum, so there is no opportunity for self.multiplier to
         # change). Omitting the assertion for efficiency.
         # assert self.multiplier == 1
-        _type, other = other
-        if _type is _CONSTANT:
-            self.constant += other
-            return
-
-        mult = other.multiplier
-        self.constant += mult * other.constant
-        if other.linear:
-            _merge_dict(self.linear, mult, other.linear)
-        if other.quadratic:
-            if not self.quadratic:
-                self.quadratic = {}
-            _merge_dict(self.quadratic, mult, other.quadratic)
-        if other.nonlinear is not None:
-            if mult != 1:
-                nl = mult * other.nonlinear
-            else:
-                nl = other.nonlinear
-            if self.nonlinear is None:
-                self.nonlinear = nl
-            else:
-                self.nonlinear += nl
+        linear = self.linear
+        for _type, other in others:
+            if _type is _CONSTANT:
+                self.constant += other
+                continue
+
+            mult = other.multiplier
+            self.constant += mult * other.constant
+            if other.linear:
+                _merge_dict(linear, mult, other.linear)
+            if other.quadratic:
+                if not self.quadratic:
+                    self.quadratic = {}
+                _merge_dict(self.quadratic, mult, other.quadratic)
+            if other.nonlinear is not None:
+                if mult != 1:
+                    nl = mult * other.nonlinear
+                else:
+                    nl = other.nonlinear
+                if self.nonlinear is None:
+                    self.nonlinear = nl
+                else:
+                    self.nonlinear += nl
 
 
 _exit_node_handlers = copy.deepcopy(linear._exit_node_handlers)
@@ -227,9 +240,9 @@ def _handle_product_nonlinear(visitor, node, arg1, arg2):
         # [BA], [CA]
         c = x2.constant
         if c == 1:
-            ans.linear = dict(x1.linear)
+            ans.linear = x1.linear.copy()
             if x1.quadratic:
-                ans.quadratic = dict(x1.quadratic)
+                ans.quadratic = x1.quadratic.copy()
         else:
             ans.linear = {vid: c * coef for vid, coef in x1.linear.items()}
             if x1.quadratic:
@@ -242,7 +255,7 @@ def _handle_product_nonlinear(visitor, node, arg1, arg2):
             if ans.quadratic:
                 _merge_dict(ans.quadratic, x1.constant, x2.quadratic)
             elif x1.constant == 1:
-                ans.quadratic = dict(x2.quadratic)
+                ans.quadratic = x2.quadratic.copy()
             else:
                 c = x1.constant
                 ans.quadratic = {k: c * coef for k, coef in x2.quadratic.items()}
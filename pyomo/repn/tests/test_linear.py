@@ -15,10 +15,20 @@ from pyomo.common.log import LoggingIntercept
 from pyomo.common.dependencies import numpy, numpy_available
 
 from pyomo.core.expr.compare import assertExpressionsEqual
-from pyomo.core.expr.numeric_expr import LinearExpression, MonomialTermExpression
+from pyomo.core.expr.numeric_expr import (
+    DivisionExpression,
+    Expr_ifExpression,
+    LinearExpression,
+    MonomialTermExpression,
+    NPV_DivisionExpression,
+    NPV_Expr_ifExpression,
+    NPV_PowExpression,
+    PowExpression,
+)
 from pyomo.core.expr import Expr_if, inequality, LinearExpression, NPV_SumExpression
 import pyomo.repn.linear as linear
 from pyomo.repn.linear import LinearRepn, LinearRepnVisitor
+from pyomo.repn.quadratic import QuadraticRepnVisitor
 from pyomo.repn.util import InvalidNumber
 
 from pyomo.environ import (
@@ -310,6 +320,33 @@ class TestLinear(unittest.TestCase):
         self.assertEqual(repn.linear, {})
         self.assertEqual(repn.nonlinear, None)
 
+    def test_npv_value_cache(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param(mutable=True, initialize=4)
+
+        npv = 2 * m.p
+        e1 = npv * m.x
+        e2 = npv + m.x
+
+        cfg = VisitorConfig()
+        visitor = LinearRepnVisitor(*cfg)
+        repn = visitor.walk_expression(e1)
+        self.assertEqual(repn.constant, 0)
+        self.assertEqual(repn.linear, {id(m.x): 8})
+        self.assertEqual(visitor.value_cache, {id(npv): (npv, 8)})
+
+        repn = visitor.walk_expression(e2)
+        self.assertEqual(repn.constant, 8)
+        self.assertEqual(repn.linear, {id(m.x): 1})
+        self.assertEqual(visitor.value_cache, {id(npv): (npv, 8)})
+
+        # Leaf (Param) coefficients are not cached
+        repn = visitor.walk_expression(m.p * m.x + m.p)
+        self.assertEqual(repn.constant, 4)
+        self.assertEqual(repn.linear, {id(m.x): 4})
+        self.assertEqual(visitor.value_cache, {id(npv): (npv, 8)})
+
     def test_monomial(self):
         m = ConcreteModel()
         m.x = Var()
@@ -1545,6 +1582,38 @@ class TestLinear(unittest.TestCase):
         finally:
             linear._before_child_dispatcher = _orig_dispatcher
 
+    def test_npv_exit_handlers_registered(self):
+        # NPV types are registered with the exit node dispatcher up
+        # front: the before child dispatcher is shared with the
+        # QuadraticRepnVisitor, so we cannot rely on registering the
+        # NPV types when they are first encountered
+        dispatcher = LinearRepnVisitor.exit_node_dispatcher
+        self.assertIs(
+            dispatcher[NPV_DivisionExpression], dispatcher[DivisionExpression]
+        )
+        self.assertIs(dispatcher[NPV_PowExpression], dispatcher[PowExpression])
+
+        # ...including for derived visitors that replace base class handlers
+        dispatcher = QuadraticRepnVisitor.exit_node_dispatcher
+        self.assertIs(dispatcher[NPV_Expr_ifExpression], dispatcher[Expr_ifExpression])
+        self.assertIs(
+            dispatcher[NPV_DivisionExpression], dispatcher[DivisionExpression]
+        )
+
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param(mutable=True, initialize=0)
+        e = m.x + 1 / m.p
+
+        cfg = VisitorConfig()
+        with LoggingIntercept() as LOG:
+            repn = LinearRepnVisitor(*cfg).walk_expression(e)
+        self.assertIn("division by zero", LOG.getvalue())
+        self.assertEqual(repn.multiplier, 1)
+        self.assertEqual(str(repn.constant), 'InvalidNumber(nan)')
+        self.assertEqual(repn.linear, {id(m.x): 1})
+        self.assertEqual(repn.nonlinear, None)
+
     def test_to_expression(self):
         m = ConcreteModel()
         m.x = Var()
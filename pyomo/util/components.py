@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from pyomo.core.base.block import _BlockData
 from pyomo.core.base.reference import Reference
 from pyomo.common.collections import ComponentMap
 from pyomo.common.modeling import unique_component_name
@@ -51,19 +52,22 @@ def rename_components(model, component_list, prefix):
             for k, v in c._data.items():
                 refs[c][k] = (v.parent_block(), v.local_name)
 
-    # Now rename all the non-Reference components
+    # Now rename all the non-Reference components, grouping them by
+    # their parent block so that each block is updated in one pass
     name_map = ComponentMap()
+    components_by_block = {}
     for c in component_list:
-        # get the parent block - we will use this to ensure new names are
-        # unique and to add the new "scaled" components
         if not c.is_reference():
             # Skip References for now
             parent = c.parent_block()
-            old_name = c.name
-            new_name = unique_component_name(parent, prefix + c.local_name)
-            parent.del_component(c)
-            parent.add_component(new_name, c)
-            name_map[c] = old_name
+            if id(parent) in components_by_block:
+                components_by_block[id(parent)][1].append(c)
+            else:
+                components_by_block[id(parent)] = (parent, [c])
+    for parent, components in components_by_block.values():
+        for c in components:
+            name_map[c] = c.name
+        _rename_block_components(parent, components, prefix)
 
     # Finally, replace all the References with remapped equivalents
     for c in refs:
@@ -98,6 +102,31 @@ def rename_components(model, component_list, prefix):
     return name_map
 
 
+def _rename_block_components(block, component_list, prefix):
+    """
+    Rename (in place) the components in component_list, all of which
+    must be declared on block, using the prefix AND
+    unique_component_name
+
+    Unlike calling del_component() / add_component() for each
+    component, this reuses each component's existing declaration slot
+    on the block: the components keep their declaration order and
+    parent pointers, and no placeholders are left behind in the
+    block's declaration list.
+    """
+    decl = block._decl
+    for c in component_list:
+        old_name = c.local_name
+        new_name = unique_component_name(block, prefix + old_name)
+        decl[new_name] = decl.pop(old_name)
+        c._name = new_name
+        # Note: delegate to the next class up the MRO (and not the
+        # Block's attribute methods) so that the declaration
+        # bookkeeping above is left untouched
+        super(_BlockData, block).__delattr__(old_name)
+        super(_BlockData, block).__setattr__(new_name, c)
+
+
 def iter_component(obj):
     """
     Yield "child" objects from a component that is defined with either the `base` or `kernel` APIs.
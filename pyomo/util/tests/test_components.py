@@ -69,6 +69,31 @@ class TestUtilComponents(unittest.TestCase):
         assert hasattr(model.b, "scaled_bx_ref")
         assert model.b.scaled_bx_ref[None] is model.b.scaled_bx[2]
 
+    def test_rename_components_preserves_order(self):
+        model = pyo.ConcreteModel()
+        model.x = pyo.Var()
+        model.p = pyo.Param(initialize=1, mutable=True)
+        model.c = pyo.Constraint(expr=model.x >= model.p)
+        model.y = pyo.Var([1, 2])
+        model.scaled_y = pyo.Var()
+
+        name_map = rename_components(
+            model=model, component_list=[model.x, model.c, model.y], prefix='scaled_'
+        )
+
+        names = [c.local_name for c in model.component_objects(descend_into=False)]
+        self.assertEqual(len(names), 6)
+        self.assertEqual(names[:4], ['scaled_x', 'p', 'scaled_c', 'y_index'])
+        # scaled_y was already taken, so a unique name was generated
+        self.assertTrue(names[4].startswith('scaled_y_'))
+        self.assertEqual(names[5], 'scaled_y')
+        self.assertIs(getattr(model, names[4]), model.component(names[4]))
+        self.assertEqual(name_map[model.component(names[4])], 'y')
+        self.assertIsNone(model.component('x'))
+        self.assertFalse(hasattr(model, 'x'))
+        self.assertIs(model.scaled_x.parent_block(), model)
+        self.assertEqual(str(model.scaled_c.expr), 'p  <=  scaled_x')
+
     def assertSameComponents(self, obj, other_obj):
         for i, j in zip_longest(obj, other_obj):
             self.assertEqual(id(i), id(j))
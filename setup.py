@@ -86,6 +86,7 @@ if using_cython:
             # "pyomo/core/expr/visitor.pyx",
             "pyomo/core/util.pyx",
             "pyomo/repn/standard_repn.pyx",
+            "pyomo/repn/linear.pyx",
             "pyomo/repn/plugins/cpxlp.pyx",
             "pyomo/repn/plugins/gams_writer.pyx",
             "pyomo/repn/plugins/baron_writer.pyx",